@@ -6073,20 +6073,31 @@ ipcMain.handle('collate-documents', async (event, config) => {
 
     const proc = spawnTracked(processorPath, [moduleName, configPath]);
     let result = null;
+    // The collator writes raw UTF-8 JSON lines; decode as a stream so a
+    // character split across chunks survives, and hold any partial line
+    // until the rest of it arrives
+    let pendingLine = '';
 
+    const handleLine = (line) => {
+      if (!line.trim()) return;
+      try {
+        const msg = JSON.parse(line);
+        if (msg.type === 'progress') {
+          mainWindow.webContents.send('collate-progress', msg);
+        } else if (msg.type === 'result') {
+          result = msg;
+        } else if (msg.type === 'error') {
+          reject(new Error(msg.message));
+        }
+      } catch (e) {}
+    };
+
+    proc.stdout.setEncoding('utf8');
     proc.stdout.on('data', (data) => {
-      const lines = data.toString().split('\n').filter(l => l.trim());
+      const lines = (pendingLine + data).split('\n');
+      pendingLine = lines.pop();
       for (const line of lines) {
-        try {
-          const msg = JSON.parse(line);
-          if (msg.type === 'progress') {
-            mainWindow.webContents.send('collate-progress', msg);
-          } else if (msg.type === 'result') {
-            result = msg;
-          } else if (msg.type === 'error') {
-            reject(new Error(msg.message));
-          }
-        } catch (e) {}
+        handleLine(line);
       }
     });
 
@@ -6095,6 +6106,9 @@ ipcMain.handle('collate-documents', async (event, config) => {
     });
 
     proc.on('close', (code) => {
+      handleLine(pendingLine);
+      pendingLine = '';
+
       // Clean up config file
       try { fs.unlinkSync(configPath); } catch (e) {}
 
@@ -10,9 +10,9 @@ The key insight: Word track changes are stored in the OOXML as:
 - Comments are stored in comments.xml with references in document.xml
 
 This version:
-1. Copies the base document to preserve ALL formatting
+1. Keeps every part of the base document to preserve ALL formatting
 2. Extracts track changes from each commented version
-3. Merges track changes into the copy by modifying the XML directly
+3. Merges track changes by modifying the XML directly, writing the output once
 """
 
 import os
@@ -21,9 +21,32 @@ import json
 import shutil
 import zipfile
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from xml.etree import ElementTree as ET
+from collections import defaultdict
 from copy import deepcopy
+from dataclasses import dataclass
+from typing import Optional
+from xml.sax.saxutils import escape, quoteattr
+
+from process_pool import available_cpu_count
+
+# lxml parses and serializes in C and keeps the document's own namespace
+# prefixes; it ships with python-docx, but fall back to the stdlib just in case
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    from xml.etree import ElementTree as ET
+    HAS_LXML = False
+
+# orjson serializes the progress messages in Rust; optional, json is the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 
 # Word XML namespaces
@@ -41,21 +64,149 @@ NAMESPACES = {
 for prefix, uri in NAMESPACES.items():
     ET.register_namespace(prefix, uri)
 
+# Clark-notation ({namespace}local) names for the WordprocessingML tags and
+# attributes touched below
+W = '{' + NAMESPACES['w'] + '}'
+W_AUTHOR = W + 'author'
+W_BODY = W + 'body'
+W_COMMENT = W + 'comment'
+W_COMMENTS = W + 'comments'
+W_DATE = W + 'date'
+W_DEL = W + 'del'
+W_DEL_TEXT = W + 'delText'
+W_ID = W + 'id'
+W_INS = W + 'ins'
+W_P = W + 'p'
+W_R = W + 'r'
+W_T = W + 't'
+W_TRACK_REVISIONS = W + 'trackRevisions'
+W_VAL = W + 'val'
+
+# Author name in docProps/core.xml
+CREATOR_RE = re.compile(rb'<dc:creator\b[^>]*>([^<]+)</dc:creator>')
+
+# Below this much word/document.xml across the reviewed documents, reading them
+# in-process is quicker than starting worker processes
+PARALLEL_EXTRACT_MIN_BYTES = 20_000_000
+
+# Media formats that are already compressed; deflating them again only costs CPU
+PRECOMPRESSED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.wdp', '.mp3', '.mp4')
+
+# settings.xml as Word writes it, for splicing in w:trackRevisions
+SETTINGS_CLOSE = b'</w:settings>'
+TRACK_REVISIONS_XML = b'<w:trackRevisions w:val="true"/>'
+
+# Markup for one merged revision; the batch wrapper lets all of them be parsed
+# with a single parser call
+REVISION_TEMPLATE = (
+    '<w:{tag} w:author={author} w:date={date}><w:r>'
+    '<w:{text_tag} xml:space="preserve">{text}</w:{text_tag}></w:r></w:{tag}>'
+)
+REVISION_BATCH_OPEN = '<w:revisions xmlns:w="' + NAMESPACES['w'] + '">'
+REVISION_BATCH_CLOSE = '</w:revisions>'
+
+XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+
+def parse_xml(data):
+    """Parse an XML part from raw zip bytes."""
+    if HAS_LXML:
+        return ET.fromstring(data, ET.XMLParser(huge_tree=True))
+    return ET.fromstring(data)
+
+
+def iterparse_tags(source, *tags):
+    """Stream ('start'|'end', element) events for the given tags from an XML part."""
+    if HAS_LXML:
+        return ET.iterparse(source, events=('start', 'end'), tag=tags, huge_tree=True)
+    return ((event, el) for event, el in ET.iterparse(source, events=('start', 'end')) if el.tag in tags)
+
+
+def release_element(elem):
+    """Free a fully-processed element (and, under lxml, its earlier siblings)."""
+    elem.clear()
+    if HAS_LXML:
+        parent = elem.getparent()
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def serialize_xml(root):
+    """Serialize an XML part to bytes with the declaration Word writes."""
+    if HAS_LXML:
+        return ET.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+    return XML_DECLARATION + ET.tostring(root, encoding='unicode').encode('utf-8')
+
+
+# UTF-8 JSON lines queued by queue_emit(), written out by the next emit()/flush_emit()
+_pending = []
+
+
+def encode_message(message):
+    """Serialize one message for the Electron app as UTF-8 JSON."""
+    if HAS_ORJSON:
+        return orjson.dumps(message)
+    return json.dumps(message).encode('utf-8')
+
+
+@dataclass(slots=True)
+class Change:
+    """One tracked insertion, deletion or comment from a reviewer's document."""
+    author: str
+    date: str
+    text: str
+    paragraph_index: Optional[int] = None  # not tracked for comments
+
 
 def emit(msg_type, **kwargs):
     """Output JSON message to stdout for the Electron app."""
-    print(json.dumps({"type": msg_type, **kwargs}), flush=True)
+    queue_emit(msg_type, **kwargs)
+    flush_emit()
+
+
+def queue_emit(msg_type, **kwargs):
+    """Queue a JSON message to go out with the next phase update."""
+    _pending.append(encode_message({"type": msg_type, **kwargs}))
+
+
+def flush_emit():
+    """Write all queued messages to stdout with a single write and flush."""
+    if not _pending:
+        return
+    payload = b'\n'.join(_pending) + b'\n'
+    _pending.clear()
+
+    # Write the bytes directly so non-ASCII text (orjson does not escape it)
+    # is not at the mercy of the console code page; the app reads UTF-8
+    sys.stdout.flush()
+    stream = getattr(sys.stdout, 'buffer', None)
+    if stream is None:
+        sys.stdout.write(payload.decode('utf-8'))
+        stream = sys.stdout
+    else:
+        stream.write(payload)
+    stream.flush()
 
 
 def get_author_from_docx(docx_path):
     """Try to extract author from document properties or use filename."""
     try:
         with zipfile.ZipFile(docx_path, 'r') as zf:
-            if 'docProps/core.xml' in zf.namelist():
-                core_xml = zf.read('docProps/core.xml').decode('utf-8')
-                match = re.search(r'<dc:creator[^>]*>([^<]+)</dc:creator>', core_xml)
-                if match:
-                    return match.group(1).strip()
+            return read_author_from_zip(zf, docx_path)
+    except:
+        pass
+    # Fall back to filename without extension
+    return os.path.splitext(os.path.basename(docx_path))[0]
+
+
+def read_author_from_zip(zf, docx_path):
+    """Extract author from an already-open .docx zip, or use filename."""
+    try:
+        if 'docProps/core.xml' in zf.namelist():
+            # Match on the raw bytes; only the author name needs decoding
+            match = CREATOR_RE.search(zf.read('docProps/core.xml'))
+            if match:
+                return match.group(1).decode('utf-8').strip()
     except:
         pass
     # Fall back to filename without extension
@@ -67,112 +218,118 @@ def extract_track_changes_from_docx(docx_path):
     Extract all track changes (insertions and deletions) from a Word document.
 
     Returns a dict with:
-    - insertions: list of {author, date, text, paragraph_index}
-    - deletions: list of {author, date, text, paragraph_index}
-    - comments: list of {author, date, text, paragraph_index}
+    - insertions: list of Change(author, date, text, paragraph_index)
+    - deletions: list of Change(author, date, text, paragraph_index)
+    - comments: list of Change(author, date, text)
+    - author: the document's author, used where a revision has none
+    - warning: message for the app if the document could not be read, else None
+      (returned rather than emitted, since this may run in a worker process)
     """
     changes = {
         'insertions': [],
         'deletions': [],
         'comments': [],
-        'author': get_author_from_docx(docx_path)
+        'author': os.path.splitext(os.path.basename(docx_path))[0],
+        'warning': None
     }
 
     try:
         with zipfile.ZipFile(docx_path, 'r') as zf:
+            # Read the author from the same handle as the document parts
+            changes['author'] = read_author_from_zip(zf, docx_path)
+
             # Read document.xml
             if 'word/document.xml' not in zf.namelist():
                 return changes
 
-            doc_xml = zf.read('word/document.xml').decode('utf-8')
-            root = ET.fromstring(doc_xml)
-
-            # Find the body
-            body = root.find('.//w:body', NAMESPACES)
-            if body is None:
-                return changes
-
-            # Track paragraph index
-            para_idx = 0
-
-            for para in body.findall('.//w:p', NAMESPACES):
-                # Find insertions in this paragraph
-                for ins in para.findall('.//w:ins', NAMESPACES):
-                    author = ins.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}author', changes['author'])
-                    date = ins.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}date', '')
-
-                    # Get text from all runs inside the insertion
-                    text_parts = []
-                    for t in ins.findall('.//w:t', NAMESPACES):
-                        if t.text:
-                            text_parts.append(t.text)
-
-                    if text_parts:
-                        changes['insertions'].append({
-                            'author': author,
-                            'date': date,
-                            'text': ''.join(text_parts),
-                            'paragraph_index': para_idx
-                        })
-
-                # Find deletions in this paragraph
-                for dele in para.findall('.//w:del', NAMESPACES):
-                    author = dele.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}author', changes['author'])
-                    date = dele.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}date', '')
-
-                    # Get text from delText elements
-                    text_parts = []
-                    for dt in dele.findall('.//w:delText', NAMESPACES):
-                        if dt.text:
-                            text_parts.append(dt.text)
-
-                    if text_parts:
-                        changes['deletions'].append({
-                            'author': author,
-                            'date': date,
-                            'text': ''.join(text_parts),
-                            'paragraph_index': para_idx
-                        })
-
-                para_idx += 1
+            # Stream document.xml in document order so only the paragraph
+            # being read is held in memory. Every w:p start bumps the
+            # paragraph index (the same numbering the merge step uses), and
+            # each revision belongs to the paragraph open when it starts.
+            para_idx = -1
+            open_revisions = []  # paragraph index of each enclosing w:ins/w:del
+
+            with zf.open('word/document.xml') as doc_xml:
+                for event, elem in iterparse_tags(doc_xml, W_P, W_INS, W_DEL):
+                    if event == 'start':
+                        if elem.tag == W_P:
+                            para_idx += 1
+                        else:
+                            open_revisions.append(para_idx)
+                        continue
+
+                    if elem.tag == W_P:
+                        # Done with this paragraph unless a revision around it
+                        # still needs its text
+                        if not open_revisions:
+                            release_element(elem)
+                        continue
+
+                    revision_para_idx = open_revisions.pop()
+                    if revision_para_idx >= 0:
+                        record_revision(elem, revision_para_idx, changes)
 
             # Read comments if they exist
             if 'word/comments.xml' in zf.namelist():
-                comments_xml = zf.read('word/comments.xml').decode('utf-8')
-                comments_root = ET.fromstring(comments_xml)
-
-                for comment in comments_root.findall('.//w:comment', NAMESPACES):
-                    author = comment.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}author', changes['author'])
-                    date = comment.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}date', '')
-
-                    # Get comment text
-                    text_parts = []
-                    for t in comment.findall('.//w:t', NAMESPACES):
-                        if t.text:
-                            text_parts.append(t.text)
-
-                    if text_parts:
-                        changes['comments'].append({
-                            'author': author,
-                            'date': date,
-                            'text': ''.join(text_parts)
-                        })
+                with zf.open('word/comments.xml') as comments_xml:
+                    for event, comment in iterparse_tags(comments_xml, W_COMMENT):
+                        if event != 'end':
+                            continue
+
+                        attrib = comment.attrib
+                        author = attrib.get(W_AUTHOR, changes['author'])
+                        date = attrib.get(W_DATE, '')
+
+                        # Get comment text
+                        text = ''.join(t.text for t in comment.iter(W_T) if t.text)
+
+                        if text:
+                            changes['comments'].append(Change(author, date, text))
+
+                        release_element(comment)
 
     except Exception as e:
-        emit("progress", percent=0, message=f"Warning: Error reading {docx_path}: {str(e)}")
+        changes['warning'] = f"Warning: Error reading {docx_path}: {str(e)}"
 
     return changes
 
 
+def record_revision(elem, para_idx, changes):
+    """Append a finished w:ins or w:del element to the matching changes list."""
+    attrib = elem.attrib
+    author = attrib.get(W_AUTHOR, changes['author'])
+    date = attrib.get(W_DATE, '')
+
+    if elem.tag == W_INS:
+        # Get text from all runs inside the insertion
+        text_tag, target = W_T, changes['insertions']
+    else:
+        # Get text from delText elements
+        text_tag, target = W_DEL_TEXT, changes['deletions']
+
+    # Only the run text elements count; itertext() would also pick up field
+    # codes (w:instrText) and other non-visible text
+    text = ''.join(t.text for t in elem.iter(text_tag) if t.text)
+
+    if text:
+        target.append(Change(author, date, text, para_idx))
+
+
 def merge_track_changes_into_document(base_path, all_changes, output_path):
     """
     Merge track changes from multiple documents into a copy of the base document.
 
     This works by:
-    1. Copying the base document (preserves all formatting)
-    2. Reading the document.xml
+    1. Reading the base document's parts (preserves all formatting)
+    2. Parsing the document.xml
     3. Finding where to insert track changes based on text matching
-    4. Writing the modified document.xml back
+    4. Writing the output zip once with the modified document.xml
+
+    Unchanged members are streamed through in chunks rather than held in
+    memory, but they are still decompressed and recompressed: zipfile has no
+    public API for copying a member's compressed bytes as they are. Only
+    already-compressed media (PRECOMPRESSED_EXTENSIONS) skip the deflate, by
+    being written stored.
 
     Args:
         base_path: Path to the original base document
@@ -182,9 +339,6 @@ def merge_track_changes_into_document(base_path, all_changes, output_path):
     Returns:
         dict with counts of changes merged
     """
-    # Copy base document to output
-    shutil.copy2(base_path, output_path)
-
     total_insertions = 0
     total_deletions = 0
     total_comments = 0
@@ -195,8 +349,9 @@ def merge_track_changes_into_document(base_path, all_changes, output_path):
         total_deletions += len(changes['deletions'])
         total_comments += len(changes['comments'])
 
-    # If there are no changes, just return the copy
+    # If there are no changes, the output is just a copy of the base
     if total_insertions == 0 and total_deletions == 0 and total_comments == 0:
+        shutil.copy2(base_path, output_path)
         return {
             'insertions': 0,
             'deletions': 0,
@@ -207,127 +362,113 @@ def merge_track_changes_into_document(base_path, all_changes, output_path):
     # This is complex because we need to preserve the XML structure
 
     try:
-        # Read the output document as a zip
-        with zipfile.ZipFile(output_path, 'r') as zf:
-            doc_xml = zf.read('word/document.xml').decode('utf-8')
-            all_files = {name: zf.read(name) for name in zf.namelist()}
-
-        # Parse the document
-        root = ET.fromstring(doc_xml)
-        body = root.find('.//w:body', NAMESPACES)
-
-        if body is not None:
-            # Get all paragraphs
-            paragraphs = body.findall('.//w:p', NAMESPACES)
-
-            # For each set of changes, try to apply them
-            for changes in all_changes:
-                author = changes['author']
-
-                # Apply insertions (mark with w:ins)
-                for ins in changes['insertions']:
-                    # Find the target paragraph (simplified: use index if available)
-                    para_idx = ins.get('paragraph_index', 0)
-                    if para_idx < len(paragraphs):
-                        para = paragraphs[para_idx]
-
-                        # Create an insertion element
-                        ins_elem = ET.SubElement(para, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}ins')
-                        ins_elem.set('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}author', author)
-                        ins_elem.set('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}date', ins.get('date', datetime.now().isoformat()))
-
-                        # Add run with text
-                        run = ET.SubElement(ins_elem, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}r')
-                        text = ET.SubElement(run, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t')
-                        text.text = ins['text']
-
-                # Apply deletions (mark with w:del)
-                for dele in changes['deletions']:
-                    para_idx = dele.get('paragraph_index', 0)
-                    if para_idx < len(paragraphs):
-                        para = paragraphs[para_idx]
-
-                        # Create a deletion element
-                        del_elem = ET.SubElement(para, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}del')
-                        del_elem.set('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}author', author)
-                        del_elem.set('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}date', dele.get('date', datetime.now().isoformat()))
-
-                        # Add run with deleted text
-                        run = ET.SubElement(del_elem, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}r')
-                        del_text = ET.SubElement(run, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}delText')
-                        del_text.text = dele['text']
-
-        # Convert back to string
-        new_doc_xml = ET.tostring(root, encoding='unicode')
-
-        # Add XML declaration
-        new_doc_xml = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + new_doc_xml
-
-        # Write back to zip
-        all_files['word/document.xml'] = new_doc_xml.encode('utf-8')
-
-        # Handle comments - merge into comments.xml
-        all_comments = []
-        for changes in all_changes:
-            for comment in changes['comments']:
-                comment['source_author'] = changes['author']
-                all_comments.append(comment)
-
-        if all_comments:
-            # Create or update comments.xml
-            if 'word/comments.xml' in all_files:
-                comments_root = ET.fromstring(all_files['word/comments.xml'].decode('utf-8'))
-            else:
-                comments_root = ET.Element('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}comments')
-
-            comment_id = 0
-            for comment in all_comments:
-                comm_elem = ET.SubElement(comments_root, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}comment')
-                comm_elem.set('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}id', str(comment_id))
-                comm_elem.set('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}author', comment.get('author', comment.get('source_author', 'Unknown')))
-                comm_elem.set('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}date', comment.get('date', datetime.now().isoformat()))
-
-                # Add paragraph with text
-                para = ET.SubElement(comm_elem, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p')
-                run = ET.SubElement(para, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}r')
-                text = ET.SubElement(run, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t')
-                text.text = comment['text']
-
-                comment_id += 1
-
-            comments_xml = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + ET.tostring(comments_root, encoding='unicode')
-            all_files['word/comments.xml'] = comments_xml.encode('utf-8')
-
-        # Enable track changes in settings.xml
-        if 'word/settings.xml' in all_files:
-            try:
-                settings_xml = all_files['word/settings.xml'].decode('utf-8')
-                settings_root = ET.fromstring(settings_xml)
-
-                # Add trackRevisions element to enable track changes
-                # Check if it already exists
-                track_rev = settings_root.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}trackRevisions')
-                if track_rev is None:
-                    # Add trackRevisions element
-                    track_rev = ET.SubElement(settings_root, '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}trackRevisions')
-
-                # Set val to true (or just having the element enables it)
-                track_rev.set('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val', 'true')
-
-                settings_xml = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + ET.tostring(settings_root, encoding='unicode')
-                all_files['word/settings.xml'] = settings_xml.encode('utf-8')
-            except Exception as e:
-                emit("progress", percent=0, message=f"Warning: Could not enable track changes: {str(e)}")
-
-        # Write the new zip file
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for name, content in all_files.items():
-                zf.writestr(name, content)
+        # Read only the parts we rewrite from the base zip; everything else is
+        # streamed straight into the output, which is written exactly once
+        with zipfile.ZipFile(base_path, 'r') as src:
+            member_names = set(src.namelist())
+            updated_parts = {}
+
+            # Parse the document
+            root = parse_xml(src.read('word/document.xml'))
+            body = root.find(W_BODY)
+
+            if body is not None:
+                # Get all paragraphs, in the same document order extraction counts them
+                paragraphs = list(body.iter(W_P))
+
+                # Write every revision as markup, grouped by target paragraph,
+                # and parse them all in one go rather than node by node
+                fragments_by_para = defaultdict(list)
+                for changes in all_changes:
+                    author = quoteattr(changes['author'])
+
+                    # Insertions (w:ins) and deletions (w:del, text in w:delText)
+                    for key, tag, text_tag in (('insertions', 'ins', 't'), ('deletions', 'del', 'delText')):
+                        for change in changes[key]:
+                            # Find the target paragraph (simplified: use index if available)
+                            para_idx = change.paragraph_index
+                            if para_idx < len(paragraphs):
+                                fragments_by_para[para_idx].append(REVISION_TEMPLATE.format(
+                                    tag=tag,
+                                    text_tag=text_tag,
+                                    author=author,
+                                    date=quoteattr(change.date),
+                                    text=escape(change.text),
+                                ))
+
+                if fragments_by_para:
+                    markup = [REVISION_BATCH_OPEN]
+                    for fragments in fragments_by_para.values():
+                        markup.append('<w:p>')
+                        markup.extend(fragments)
+                        markup.append('</w:p>')
+                    markup.append(REVISION_BATCH_CLOSE)
+
+                    # One wrapper w:p per target paragraph, in the same order
+                    batch = parse_xml(''.join(markup).encode('utf-8'))
+                    for para_idx, revisions in zip(fragments_by_para, list(batch)):
+                        paragraphs[para_idx].extend(list(revisions))
+
+            # Serialize back (with XML declaration) for the zip
+            updated_parts['word/document.xml'] = serialize_xml(root)
+
+            # Handle comments - merge into comments.xml
+            all_comments = [comment for changes in all_changes for comment in changes['comments']]
+
+            if all_comments:
+                # Create or update comments.xml
+                if 'word/comments.xml' in member_names:
+                    comments_root = parse_xml(src.read('word/comments.xml'))
+                else:
+                    comments_root = ET.Element(W_COMMENTS)
+
+                comment_id = 0
+                for comment in all_comments:
+                    comm_elem = ET.SubElement(comments_root, W_COMMENT)
+                    comm_elem.set(W_ID, str(comment_id))
+                    comm_elem.set(W_AUTHOR, comment.author)
+                    comm_elem.set(W_DATE, comment.date)
+
+                    # Add paragraph with text
+                    para = ET.SubElement(comm_elem, W_P)
+                    run = ET.SubElement(para, W_R)
+                    text = ET.SubElement(run, W_T)
+                    text.text = comment.text
+
+                    comment_id += 1
+
+                updated_parts['word/comments.xml'] = serialize_xml(comments_root)
+
+            # Enable track changes in settings.xml
+            if 'word/settings.xml' in member_names:
+                try:
+                    updated_parts['word/settings.xml'] = enable_track_revisions(
+                        src.read('word/settings.xml'))
+                except Exception as e:
+                    emit("progress", percent=0, message=f"Warning: Could not enable track changes: {str(e)}")
+
+            # Write the new zip file: rewritten parts replace their originals,
+            # every other member is streamed through in chunks (decompressed
+            # and recompressed; see the docstring)
+            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as dst:
+                for info in src.infolist():
+                    out_info = copy_zip_info(info)
+                    if info.filename in updated_parts:
+                        dst.writestr(out_info, updated_parts.pop(info.filename))
+                    else:
+                        with src.open(info) as member, dst.open(out_info, 'w') as out:
+                            shutil.copyfileobj(member, out)
+
+                # Parts the base document did not have yet (e.g. comments.xml)
+                for name, content in updated_parts.items():
+                    dst.writestr(name, content)
 
     except Exception as e:
         emit("progress", percent=0, message=f"Warning: Error merging changes: {str(e)}")
         import traceback
         traceback.print_exc()
+        # Fall back to an untouched copy of the base document
+        shutil.copy2(base_path, output_path)
 
     return {
         'insertions': total_insertions,
@@ -336,8 +477,51 @@ def merge_track_changes_into_document(base_path, all_changes, output_path):
     }
 
 
-def create_summary(base_path, modified_paths, stats, output_folder):
-    """Create a simple text summary of the collation."""
+def enable_track_revisions(settings_xml):
+    """Return settings.xml bytes with w:trackRevisions switched on."""
+    # Common case: no trackRevisions yet, so splice the element in as the
+    # last child of w:settings without building a tree
+    if b'<w:trackRevisions' not in settings_xml:
+        close_pos = settings_xml.rfind(SETTINGS_CLOSE)
+        if close_pos != -1:
+            return settings_xml[:close_pos] + TRACK_REVISIONS_XML + settings_xml[close_pos:]
+
+    settings_root = parse_xml(settings_xml)
+
+    # Add trackRevisions element to enable track changes
+    # Check if it already exists (always a direct child of w:settings)
+    track_rev = settings_root.find(W_TRACK_REVISIONS)
+    if track_rev is None:
+        # Add trackRevisions element
+        track_rev = ET.SubElement(settings_root, W_TRACK_REVISIONS)
+
+    # Set val to true (or just having the element enables it)
+    track_rev.set(W_VAL, 'true')
+
+    return serialize_xml(settings_root)
+
+
+def copy_zip_info(info):
+    """Fresh ZipInfo for writing a member with the same name, timestamp and compression."""
+    out_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    if info.filename.lower().endswith(PRECOMPRESSED_EXTENSIONS):
+        out_info.compress_type = zipfile.ZIP_STORED
+    else:
+        out_info.compress_type = info.compress_type
+    out_info.external_attr = info.external_attr
+    out_info.file_size = info.file_size  # lets zipfile decide on ZIP64 up front
+    return out_info
+
+
+def create_summary(base_path, modified_paths, stats, output_folder, authors_by_path=None):
+    """
+    Create a simple text summary of the collation.
+
+    authors_by_path maps each modified path to the author already read during
+    extraction, so the summary does not have to reopen every document.
+    """
+    authors_by_path = authors_by_path or {}
+
     summary_lines = [
         "Document Collation Summary",
         "=" * 50,
@@ -350,7 +534,9 @@ def create_summary(base_path, modified_paths, stats, output_folder):
     ]
 
     for path in modified_paths:
-        author = get_author_from_docx(path)
+        author = authors_by_path.get(path)
+        if author is None:
+            author = get_author_from_docx(path)
         summary_lines.append(f"  • {os.path.basename(path)} (Author: {author})")
 
     summary_lines.extend([
@@ -371,6 +557,15 @@ def create_summary(base_path, modified_paths, stats, output_folder):
     return summary_path
 
 
+def document_xml_size(docx_path):
+    """Uncompressed size of a .docx's word/document.xml, or 0 if unreadable."""
+    try:
+        with zipfile.ZipFile(docx_path, 'r') as zf:
+            return zf.getinfo('word/document.xml').file_size
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return 0
+
+
 def collate_documents(base_path, modified_paths, output_folder):
     """
     Main collation function.
@@ -396,29 +591,44 @@ def collate_documents(base_path, modified_paths, output_folder):
         if os.path.isfile(p):
             valid_modified.append(p)
         else:
-            emit("progress", percent=0, message=f"Warning: Skipping missing file {p}")
+            queue_emit("progress", percent=0, message=f"Warning: Skipping missing file {p}")
 
     if not valid_modified:
         raise ValueError("No valid modified documents found")
 
     emit("progress", percent=20, message=f"Extracting changes from {len(valid_modified)} documents...")
 
-    # Extract track changes from all modified documents
+    # Extract track changes from all modified documents. Parsing is CPU-bound
+    # and each document is independent, so large jobs are spread over worker
+    # processes; small ones are read in-process, since starting a pool (spawn
+    # on Windows and macOS) costs far more than parsing a few documents.
+    # map() keeps results in input order.
+    max_workers = max(1, min(available_cpu_count(), len(valid_modified)))
+    total_bytes = sum(document_xml_size(p) for p in valid_modified)
+    if max_workers > 1 and total_bytes >= PARALLEL_EXTRACT_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            extracted = list(executor.map(extract_track_changes_from_docx, valid_modified))
+    else:
+        extracted = [extract_track_changes_from_docx(p) for p in valid_modified]
+
+    # Per-document messages are queued and go out with the next phase update
     all_changes = []
-    for i, mod_path in enumerate(valid_modified):
-        percent = 20 + int((i / len(valid_modified)) * 40)
-        emit("progress", percent=percent, message=f"Reading {os.path.basename(mod_path)}...")
-
-        changes = extract_track_changes_from_docx(mod_path)
+    authors_by_path = {}
+    for i, (mod_path, changes) in enumerate(zip(valid_modified, extracted)):
+        percent = 20 + int(((i + 1) / len(valid_modified)) * 40)
+        if changes['warning']:
+            queue_emit("progress", percent=0, message=changes['warning'])
+        queue_emit("progress", percent=percent, message=f"Read {os.path.basename(mod_path)}")
         all_changes.append(changes)
+        authors_by_path[mod_path] = changes['author']
 
         # Log what we found
         ins_count = len(changes['insertions'])
         del_count = len(changes['deletions'])
         comm_count = len(changes['comments'])
         if ins_count + del_count + comm_count > 0:
-            emit("progress", percent=percent,
-                 message=f"Found {ins_count} insertions, {del_count} deletions, {comm_count} comments in {os.path.basename(mod_path)}")
+            queue_emit("progress", percent=percent,
+                       message=f"Found {ins_count} insertions, {del_count} deletions, {comm_count} comments in {os.path.basename(mod_path)}")
 
     emit("progress", percent=65, message="Merging changes into base document...")
 
@@ -431,7 +641,7 @@ def collate_documents(base_path, modified_paths, output_folder):
     emit("progress", percent=90, message="Creating summary...")
 
     # Create summary
-    summary_path = create_summary(base_path, valid_modified, stats, output_folder)
+    summary_path = create_summary(base_path, valid_modified, stats, output_folder, authors_by_path)
 
     total_changes = stats['insertions'] + stats['deletions']
 
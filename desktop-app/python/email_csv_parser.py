@@ -13,6 +13,47 @@ import csv
 import re
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
+
+
+# Compiled once: these run for every row of the CSV
+ANGLE_EMAIL_RE = re.compile(r'<([^>]+)>')
+FILENAME_RE = re.compile(
+    r'[\w\-\.\s]+\.(?:pdf|docx?|xlsx?|pptx?|csv|txt|zip|rar|png|jpg|jpeg|gif|bmp|tiff?|msg|eml|htm|html)\b',
+    re.IGNORECASE,
+)
+
+# Outlook export column names (lower-cased) → email field
+COLUMN_MAP = {
+    'subject': 'subject', 'title': 'subject',
+    'body': 'body', 'message': 'body', 'content': 'body', 'message body': 'body',
+    'from': 'from', 'sender': 'from', 'from: (address)': 'from', 'from: (name)': 'from',
+    'to': 'to', 'recipient': 'to', 'to: (address)': 'to', 'to: (name)': 'to',
+    'cc': 'cc', 'carbon copy': 'cc', 'cc: (name)': 'cc', 'cc: (address)': 'cc',
+    'date sent': 'date_sent', 'sent': 'date_sent', 'send date': 'date_sent',
+    'date received': 'date_received', 'received': 'date_received',
+    'receive date': 'date_received', 'date': 'date_received',
+    'has attachments': 'has_attachments',
+    'attachments': 'attachments', 'attachment': 'attachments',
+}
+# Fields several columns add to ("From: (Name)" and "From: (Address)")
+APPEND_FIELDS = {'from', 'to', 'cc'}
+DATE_FIELDS = {'date_sent', 'date_received'}
+FALSE_VALUES = {'no', 'false', '0', ''}
+
+# Outlook export date formats, tried in order when the fast paths below miss
+DATE_FORMATS = [
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%m/%d/%y %I:%M %p",
+]
+# US dates ("%m/%d/%Y %I:%M %p" / "%m/%d/%Y %H:%M") and ISO timestamps, read
+# without strptime's failed attempts, each of which raises a ValueError
+US_DATE_RE = re.compile(r'([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})\s+([0-9]{1,2}):([0-9]{1,2})(?:\s+([AaPp])[Mm])?')
+ISO_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})(?:\s+|[Tt])([0-9]{1,2}):([0-9]{1,2}):([0-9]{1,2})')
 
 
 def emit(msg_type, **kwargs):
@@ -20,35 +61,69 @@ def emit(msg_type, **kwargs):
     print(json.dumps({"type": msg_type, **kwargs}), flush=True)
 
 
+def _parse_common_date(date_str):
+    """
+    Read the common export formats directly; None when the string is not one
+    of them, or not a valid date, and parse_date should try every format.
+    """
+    match = US_DATE_RE.fullmatch(date_str)
+    if match:
+        month, day, year, hour, minute = map(int, match.group(1, 2, 3, 4, 5))
+        meridiem = match.group(6)
+        if meridiem:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if meridiem in 'Pp' else 0)
+        elif hour > 23 or month > 12:
+            # Hour out of range, or a day-first date: leave it to strptime
+            return None
+        if minute > 59:
+            return None
+        try:
+            return datetime(year, month, day, hour, minute)
+        except ValueError:
+            return None
+
+    match = ISO_DATE_RE.fullmatch(date_str)
+    if match:
+        year, month, day, hour, minute, second = map(int, match.groups())
+        if hour > 23 or minute > 59 or second > 59:
+            return None
+        try:
+            return datetime(year, month, day, hour, minute, second)
+        except ValueError:
+            return None
+
+    return None
+
+
 def parse_date(date_str):
     """Parse various date formats from Outlook exports."""
     if not date_str:
         return None
 
-    formats = [
-        "%m/%d/%Y %I:%M %p",
-        "%m/%d/%Y %H:%M",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S",
-        "%d/%m/%Y %H:%M",
-        "%m/%d/%y %I:%M %p",
-    ]
+    stripped = date_str.strip()
+    parsed = _parse_common_date(stripped)
+    if parsed:
+        return parsed.isoformat()
 
-    for fmt in formats:
+    for fmt in DATE_FORMATS:
         try:
-            return datetime.strptime(date_str.strip(), fmt).isoformat()
+            return datetime.strptime(stripped, fmt).isoformat()
         except ValueError:
             continue
 
     return date_str  # Return as-is if no format matches
 
 
+@lru_cache(maxsize=65536)
 def normalize_email(email):
     """Extract email address from various formats like 'Name <email@domain.com>'."""
+    # Cached: senders and recipients repeat heavily across an export
     if not email:
         return ""
 
-    match = re.search(r'<([^>]+)>', email)
+    match = ANGLE_EMAIL_RE.search(email)
     if match:
         return match.group(1).lower().strip()
 
@@ -56,6 +131,7 @@ def normalize_email(email):
     return email.lower().strip()
 
 
+@lru_cache(maxsize=65536)
 def extract_domain(email):
     """Extract domain from email address."""
     normalized = normalize_email(email)
@@ -69,8 +145,7 @@ def extract_filenames_from_text(text):
     if not text:
         return []
     # Match common file extensions
-    pattern = r'[\w\-\.\s]+\.(?:pdf|docx?|xlsx?|pptx?|csv|txt|zip|rar|png|jpg|jpeg|gif|bmp|tiff?|msg|eml|htm|html)\b'
-    matches = re.findall(pattern, text, re.IGNORECASE)
+    matches = FILENAME_RE.findall(text)
     # Clean up matches - strip leading whitespace
     return [m.strip() for m in matches if len(m.strip()) > 4]
 
@@ -106,11 +181,12 @@ def parse_outlook_csv(csv_path):
                 except csv.Error:
                     dialect = csv.excel
 
-                reader = csv.DictReader(f, dialect=dialect)
+                reader = csv.reader(f, dialect=dialect)
+                header = next(reader, None) or []
 
                 # Capture column names
-                if reader.fieldnames:
-                    found_columns = [c.replace('\ufeff', '').strip() for c in reader.fieldnames if c]
+                if header:
+                    found_columns = [c.replace('\ufeff', '').strip() for c in header if c]
                     # Check if we have an attachment column
                     for col in found_columns:
                         col_lower = col.lower()
@@ -118,8 +194,23 @@ def parse_outlook_csv(csv_path):
                             has_attachment_column = True
                             break
 
-                # Normalize column names (Outlook exports vary)
+                # Normalize column names (Outlook exports vary) once, from the
+                # header. A repeated name keeps its first position and its last
+                # column's values, as csv.DictReader's row dicts did
+                columns = {}
+                for index, name in enumerate(header):
+                    if name:
+                        columns[name] = index
+                field_columns = []
+                for name, index in columns.items():
+                    # Strip BOM and whitespace from the column name
+                    field = COLUMN_MAP.get(name.replace('\ufeff', '').lower().strip())
+                    if field:
+                        field_columns.append((field, index))
+
                 for row in reader:
+                    if not row:
+                        continue  # Blank line
                     # Map various column names to standard fields
                     email_data = {
                         'subject': '',
@@ -133,44 +224,25 @@ def parse_outlook_csv(csv_path):
                         'has_attachments': False
                     }
 
-                    for key, value in row.items():
-                        if not key:
-                            continue
-
-                        # Strip BOM and whitespace from key
-                        key_lower = key.replace('\ufeff', '').lower().strip()
-                        value = value.strip() if value else ''
-
-                        if key_lower in ['subject', 'title']:
-                            email_data['subject'] = value
-                        elif key_lower in ['body', 'message', 'content', 'message body']:
-                            email_data['body'] = value
-                        elif key_lower in ['from', 'sender', 'from: (address)', 'from: (name)']:
-                            if email_data['from']:
-                                email_data['from'] += '; ' + value
-                            else:
-                                email_data['from'] = value
-                        elif key_lower in ['to', 'recipient', 'to: (address)', 'to: (name)']:
-                            if email_data['to']:
-                                email_data['to'] += '; ' + value
-                            else:
-                                email_data['to'] = value
-                        elif key_lower in ['cc', 'carbon copy', 'cc: (name)', 'cc: (address)']:
-                            if email_data['cc']:
-                                email_data['cc'] += '; ' + value
+                    for field, index in field_columns:
+                        value = row[index].strip() if index < len(row) else ''
+
+                        if field in APPEND_FIELDS:
+                            if email_data[field]:
+                                email_data[field] += '; ' + value
                             else:
-                                email_data['cc'] = value
-                        elif key_lower in ['date sent', 'sent', 'send date']:
-                            email_data['date_sent'] = parse_date(value)
-                        elif key_lower in ['date received', 'received', 'receive date', 'date']:
-                            email_data['date_received'] = parse_date(value)
-                        elif key_lower == 'has attachments':
+                                email_data[field] = value
+                        elif field in DATE_FIELDS:
+                            email_data[field] = parse_date(value)
+                        elif field == 'has_attachments':
                             # Boolean column from Outlook - just TRUE/FALSE
-                            email_data['has_attachments'] = bool(value and value.lower() not in ['no', 'false', '0', ''])
-                        elif key_lower in ['attachments', 'attachment']:
+                            email_data['has_attachments'] = value.lower() not in FALSE_VALUES
+                        elif field == 'attachments':
                             # Actual attachment filename(s)
                             email_data['attachments'] = value
-                            email_data['has_attachments'] = bool(value and value.lower() not in ['no', 'false', '0', ''])
+                            email_data['has_attachments'] = value.lower() not in FALSE_VALUES
+                        else:
+                            email_data[field] = value
 
                     # If no attachment column exists, try to extract filenames from subject/body
                     if not has_attachment_column:
@@ -275,18 +347,36 @@ def evaluate_boolean_query(email, tokens, search_fields):
     if not tokens:
         return False
 
-    # Build searchable text from specified fields
-    searchable_parts = []
+    return _evaluate_tokens(tokens, *_searchable_texts(email, search_fields))
+
+
+def _lowered_fields(email, search_fields):
+    """(field, lower-cased text) for each non-empty search field, in field order."""
+    lowered = []
     for field in search_fields:
         value = email.get(field, '')
         if value:
-            searchable_parts.append(value.lower())
-    searchable_text = ' '.join(searchable_parts)
+            lowered.append((field, value.lower()))
+    return lowered
+
+
+def _searchable_texts(email, search_fields, lowered=None):
+    """The (searchable text, attachment text, has attachments) a query is matched against."""
+    if lowered is None:
+        lowered = _lowered_fields(email, search_fields)
+    # Build searchable text from specified fields
+    searchable_text = ' '.join(value for _, value in lowered)
 
     # Get attachment text separately
-    attachment_text = email.get('attachments', '').lower()
+    attachment_text = next((value for field, value in lowered if field == 'attachments'), None)
+    if attachment_text is None:
+        attachment_text = email.get('attachments', '').lower()
     has_attachments = email.get('has_attachments', False)
+    return searchable_text, attachment_text, has_attachments
 
+
+def _evaluate_tokens(tokens, searchable_text, attachment_text, has_attachments):
+    """Evaluate parsed query tokens against an email's lower-cased texts."""
     # Evaluate tokens with simple boolean logic
     # Default is AND between consecutive terms
     results = []
@@ -373,22 +463,23 @@ def search_emails(emails, query, search_fields=None, attachment_only=False):
     results = []
 
     for email in emails:
-        if evaluate_boolean_query(email, tokens, search_fields):
+        # Each field is lower-cased once, for both the match and the
+        # matched-field report below
+        lowered = _lowered_fields(email, search_fields)
+        if _evaluate_tokens(tokens, *_searchable_texts(email, search_fields, lowered)):
             # Determine which fields matched (for display)
             matched_fields = []
-            for field in search_fields:
-                value = email.get(field, '')
-                if value:
-                    # Check if any search term appears in this field
-                    for token in tokens:
-                        if token['type'] in ('term', 'phrase'):
-                            if token['value'] in value.lower():
-                                matched_fields.append(field)
-                                break
-                        elif token['type'] == 'attachment' and field == 'attachments':
-                            if token['value'] in value.lower():
-                                matched_fields.append('attachments')
-                                break
+            for field, value in lowered:
+                # Check if any search term appears in this field
+                for token in tokens:
+                    if token['type'] in ('term', 'phrase'):
+                        if token['value'] in value:
+                            matched_fields.append(field)
+                            break
+                    elif token['type'] == 'attachment' and field == 'attachments':
+                        if token['value'] in value:
+                            matched_fields.append('attachments')
+                            break
 
             results.append({
                 'email': email,
@@ -13,6 +13,7 @@ Example: emna_processor signature_packets /path/to/config.json
 
 import sys
 import os
+import multiprocessing
 
 
 def main():
@@ -85,4 +86,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Worker processes spawned by a frozen executable re-enter here; let
+    # multiprocessing take over before we dispatch on argv
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+EmmaNeigh - Process Pool Helpers
+Shared sizing for the processors that spread work over worker processes.
+"""
+
+import os
+
+
+def available_cpu_count():
+    """CPUs this process may run on — respects the process affinity mask."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on Windows / macOS
+        return os.cpu_count() or 1
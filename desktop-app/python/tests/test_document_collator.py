@@ -0,0 +1,202 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+
+TESTS_DIR = Path(__file__).resolve().parent
+PYTHON_DIR = TESTS_DIR.parent
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import document_collator
+from document_collator import (
+    collate_documents,
+    create_summary,
+    enable_track_revisions,
+    extract_track_changes_from_docx,
+)
+
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+
+def _document_xml(body):
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>'
+    )
+
+
+def _write_docx(path, body, author=None, settings=True):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', '<Types/>')
+        zf.writestr('word/document.xml', _document_xml(body))
+        if settings:
+            zf.writestr(
+                'word/settings.xml',
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f'<w:settings xmlns:w="{W_NS}"><w:zoom w:percent="100"/></w:settings>',
+            )
+        if author:
+            zf.writestr(
+                'docProps/core.xml',
+                '<cp:coreProperties xmlns:cp="cp" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+                f'<dc:creator>{author}</dc:creator></cp:coreProperties>',
+            )
+
+
+BASE_BODY = (
+    '<w:p><w:r><w:t>First paragraph.</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t>Second paragraph.</w:t></w:r></w:p>'
+)
+
+REVIEWED_BODY = (
+    '<w:p><w:r><w:t>First paragraph.</w:t></w:r>'
+    '<w:ins w:author="Alice" w:date="2026-01-01T00:00:00Z"><w:r><w:t> Added text.</w:t></w:r></w:ins></w:p>'
+    '<w:p><w:del w:author="Alice" w:date="2026-01-01T00:00:00Z"><w:r><w:delText>Second</w:delText></w:r></w:del>'
+    '<w:r><w:t> paragraph.</w:t></w:r></w:p>'
+)
+
+
+class DocumentCollatorTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmpdir = self._tmp.name
+        self.base_path = os.path.join(self.tmpdir, 'base.docx')
+        self.reviewed_path = os.path.join(self.tmpdir, 'reviewed.docx')
+        _write_docx(self.base_path, BASE_BODY)
+        _write_docx(self.reviewed_path, REVIEWED_BODY, author='Alice Reviewer')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _collate(self):
+        output_folder = os.path.join(self.tmpdir, 'out')
+        with redirect_stdout(io.StringIO()):
+            return collate_documents(self.base_path, [self.reviewed_path], output_folder)
+
+    def test_collate_documents_merges_track_changes(self):
+        result = self._collate()
+
+        self.assertEqual(result['total_changes'], 2)
+        with zipfile.ZipFile(result['output_document']) as zf:
+            doc_xml = zf.read('word/document.xml').decode('utf-8')
+            settings_xml = zf.read('word/settings.xml').decode('utf-8')
+            content_types = zf.read('[Content_Types].xml')
+        self.assertEqual(content_types, b'<Types/>')
+        self.assertIn('Added text.', doc_xml)
+        self.assertIn('Second', doc_xml)
+        self.assertIn('trackRevisions', settings_xml)
+
+    def test_collate_documents_combines_several_reviewers(self):
+        second_path = os.path.join(self.tmpdir, 'reviewed_2.docx')
+        _write_docx(second_path, REVIEWED_BODY, author='Bob Reviewer')
+        output_folder = os.path.join(self.tmpdir, 'out')
+
+        with redirect_stdout(io.StringIO()):
+            result = collate_documents(self.base_path, [self.reviewed_path, second_path], output_folder)
+
+        self.assertEqual(result['documents_processed'], 2)
+        self.assertEqual(result['total_changes'], 4)
+        with open(result['summary_document']) as f:
+            summary = f.read()
+        self.assertLess(summary.index('Alice Reviewer'), summary.index('Bob Reviewer'))
+
+    def test_progress_messages_are_json_lines_in_phase_order(self):
+        output_folder = os.path.join(self.tmpdir, 'out')
+        missing_path = os.path.join(self.tmpdir, 'missing.docx')
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            collate_documents(self.base_path, [missing_path, self.reviewed_path], output_folder)
+
+        messages = [json.loads(line)['message'] for line in stdout.getvalue().splitlines()]
+        self.assertEqual(messages[0], 'Reading base document...')
+        self.assertTrue(messages[1].startswith('Warning: Skipping missing file'))
+        self.assertLess(messages.index('Read reviewed.docx'),
+                        messages.index('Merging changes into base document...'))
+        self.assertEqual(messages[-1], 'Complete!')
+
+    def test_unreadable_document_warning_is_queued_in_order(self):
+        broken_path = os.path.join(self.tmpdir, 'broken.docx')
+        with open(broken_path, 'wb') as f:
+            f.write(b'not a zip file')
+        output_folder = os.path.join(self.tmpdir, 'out')
+        original_threshold = document_collator.PARALLEL_EXTRACT_MIN_BYTES
+
+        for threshold in (original_threshold, 0):
+            document_collator.PARALLEL_EXTRACT_MIN_BYTES = threshold
+            stdout = io.StringIO()
+            try:
+                with redirect_stdout(stdout):
+                    result = collate_documents(self.base_path, [broken_path, self.reviewed_path], output_folder)
+            finally:
+                document_collator.PARALLEL_EXTRACT_MIN_BYTES = original_threshold
+
+            messages = [json.loads(line)['message'] for line in stdout.getvalue().splitlines()]
+            warning = next(i for i, m in enumerate(messages) if m.startswith('Warning: Error reading'))
+            self.assertLess(messages.index('Extracting changes from 2 documents...'), warning)
+            self.assertLess(warning, messages.index('Read broken.docx'))
+            self.assertEqual(result['total_changes'], 2)
+
+    def test_extract_attributes_revisions_to_paragraph_index(self):
+        table_body = (
+            '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'
+        )
+        _write_docx(self.reviewed_path, table_body + REVIEWED_BODY, author='Alice Reviewer')
+
+        changes = extract_track_changes_from_docx(self.reviewed_path)
+
+        self.assertEqual(changes['author'], 'Alice Reviewer')
+        self.assertEqual(
+            [(c.text, c.paragraph_index, c.author) for c in changes['insertions']],
+            [(' Added text.', 1, 'Alice')],
+        )
+        self.assertEqual(
+            [(c.text, c.paragraph_index) for c in changes['deletions']],
+            [('Second', 2)],
+        )
+
+    def test_enable_track_revisions_splices_or_updates_settings(self):
+        settings = (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<w:settings xmlns:w="{W_NS}"><w:zoom w:percent="100"/></w:settings>'
+        ).encode('utf-8')
+
+        spliced = enable_track_revisions(settings)
+        self.assertTrue(spliced.endswith(
+            b'<w:zoom w:percent="100"/><w:trackRevisions w:val="true"/></w:settings>'))
+
+        updated = enable_track_revisions(spliced.replace(b'w:val="true"', b'w:val="false"'))
+        self.assertIn(b'w:val="true"', updated)
+        self.assertEqual(updated.count(b'trackRevisions'), 1)
+
+    def test_summary_lists_author_from_core_properties(self):
+        result = self._collate()
+
+        with open(result['summary_document']) as f:
+            summary = f.read()
+        self.assertIn('reviewed.docx (Author: Alice Reviewer)', summary)
+
+    def test_create_summary_uses_known_authors_without_reopening(self):
+        missing_path = os.path.join(self.tmpdir, 'not_on_disk.docx')
+
+        summary_path = create_summary(
+            self.base_path,
+            [missing_path],
+            {'insertions': 1, 'deletions': 0, 'comments': 0},
+            self.tmpdir,
+            {missing_path: 'Cached Author'},
+        )
+
+        with open(summary_path) as f:
+            self.assertIn('(Author: Cached Author)', f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
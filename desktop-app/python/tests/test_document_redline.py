@@ -0,0 +1,248 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+
+TESTS_DIR = Path(__file__).resolve().parent
+PYTHON_DIR = TESTS_DIR.parent
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+try:
+    import document_redline
+    from document_redline import (
+        Cell,
+        Table,
+        TableRow,
+        compare_all_tables,
+        detect_column_reorder,
+        diff_tables,
+        extract_tables,
+        extract_tables_from_xlsx,
+        generate_output_xlsx,
+        match_rows_by_content,
+        match_tables,
+        process_batch,
+    )
+    from openpyxl import Workbook, load_workbook
+except Exception:
+    Cell = None
+
+
+def make_table(table_id, rows, position=(0, 0)):
+    return Table(
+        id=table_id,
+        rows=[
+            TableRow(
+                index=row_idx,
+                cells=[Cell(row=row_idx, col=col_idx, text=text) for col_idx, text in enumerate(values)],
+                is_header=(row_idx == 0),
+            )
+            for row_idx, values in enumerate(rows)
+        ],
+        position=position,
+    )
+
+
+HEADER = ["Party", "Role", "Amount"]
+ROWS = [
+    ["Acme Corp", "Borrower", "1,000,000"],
+    ["First Bank", "Lender", "600,000"],
+    ["Second Bank", "Lender", "400,000"],
+]
+
+
+@unittest.skipUnless(Cell is not None, "document redline dependencies are required")
+class DocumentRedlineTests(unittest.TestCase):
+    def changes_by_type(self, table_diff):
+        return {
+            change_type: [
+                (rc.original_index, rc.modified_index)
+                for rc in table_diff.row_changes
+                if rc.change_type == change_type
+            ]
+            for change_type in ('unchanged', 'added', 'deleted', 'modified', 'moved')
+        }
+
+    def test_inserted_row_only_marks_the_insertion(self):
+        orig = make_table("T", [HEADER] + ROWS)
+        mod = make_table("T", [HEADER, ROWS[0], ["Agent Bank", "Agent", "0"], ROWS[1], ROWS[2]])
+
+        table_diff = diff_tables(orig, mod)
+
+        self.assertEqual(table_diff.stats['added'], 1)
+        self.assertEqual(table_diff.stats['modified'], 0)
+        self.assertEqual(self.changes_by_type(table_diff)['added'], [(None, 2)])
+        self.assertFalse(table_diff.is_resorted)
+
+    def test_edited_row_is_matched_as_modified(self):
+        orig = make_table("T", [HEADER] + ROWS)
+        mod = make_table("T", [HEADER, ROWS[0], ["First Bank NA", "Lender", "650,000"], ROWS[2]])
+
+        table_diff = diff_tables(orig, mod)
+
+        self.assertEqual(self.changes_by_type(table_diff)['modified'], [(2, 2)])
+        self.assertEqual(table_diff.stats['added'], 0)
+        self.assertEqual(table_diff.stats['deleted'], 0)
+
+    def test_identical_rows_match_one_to_one(self):
+        orig = make_table("T", [HEADER] + ROWS + [ROWS[0]])
+        mod = make_table("T", [HEADER] + ROWS + [ROWS[0]])
+
+        self.assertEqual(
+            match_rows_by_content(orig, mod, {0: 0, 1: 1, 2: 2}),
+            {1: (1, 1.0), 2: (2, 1.0), 3: (3, 1.0), 4: (4, 1.0)},
+        )
+
+    def test_identical_tables_report_every_row_unchanged(self):
+        orig = make_table("T", [HEADER] + ROWS)
+        mod = make_table("T", [HEADER] + ROWS)
+
+        table_diff = diff_tables(orig, mod)
+
+        self.assertEqual(table_diff.stats['unchanged'], len(ROWS) + 1)
+        self.assertEqual(
+            [(rc.original_index, rc.modified_index) for rc in table_diff.row_changes],
+            [(0, 0), (1, 1), (2, 2), (3, 3)],
+        )
+        self.assertFalse(table_diff.is_resorted)
+
+    def test_fuzzy_header_match_maps_renamed_column(self):
+        orig = make_table("T", [HEADER] + ROWS)
+        mod = make_table("T", [["Amount", "Party", "Roles"]] + [[r[2], r[0], r[1]] for r in ROWS])
+
+        self.assertEqual(detect_column_reorder(orig, mod), {0: 1, 1: 2, 2: 0})
+
+    def test_xlsx_rows_are_padded_to_the_sheet_width(self):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Parties"
+        ws.append(["Party", "Role"])
+        ws.append(["Acme Corp"])
+        ws["D4"] = 42
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "parties.xlsx")
+            wb.save(path)
+            tables = extract_tables_from_xlsx(path)
+
+        self.assertEqual(len(tables), 1)
+        self.assertEqual(
+            [(row.index, [cell.text for cell in row.cells]) for row in tables[0].rows],
+            [
+                (0, ["Party", "Role", "", ""]),
+                (1, ["Acme Corp", "", "", ""]),
+                (3, ["", "", "", "42"]),
+            ],
+        )
+
+    def test_tables_are_matched_best_first(self):
+        # A's best candidate is B2 (same header and page), but B2 is an exact
+        # copy of B; best-first pairs B with B2 and leaves A2 for A
+        shared = [["Party", "Role"], ["Acme Corp", "Borrower"], ["First Bank", "Lender"]]
+        orig_a = make_table("A", shared + [["Second Bank", "Lender"]], (1, 0))
+        orig_b = make_table("B", shared, (1, 1))
+        mod_a = make_table("A2", shared + [["Second Bank", "Lender"], ["Third Bank", "Lender"]], (0, 0))
+        mod_b = make_table("B2", shared, (1, 0))
+
+        pairs = match_tables([orig_a, orig_b], [mod_b, mod_a])
+
+        self.assertEqual([(o.id, m.id) for o, m in pairs], [("A", "A2"), ("B", "B2")])
+
+    def test_parallel_table_diffs_match_serial_diffs(self):
+        orig_tables = [make_table("A", [HEADER] + ROWS), make_table("B", [["Name"], ["x"], ["y"]], (1, 0))]
+        mod_tables = [make_table("A", [HEADER] + ROWS[::-1]), make_table("B", [["Name"], ["y"], ["z"]], (1, 0))]
+
+        def summarize(results):
+            return [(o.id, m.id, d.stats, [(r.change_type, r.original_index, r.modified_index) for r in d.row_changes])
+                    for o, m, d in results]
+
+        serial = summarize(compare_all_tables(orig_tables, mod_tables, parallel=False))
+        original_threshold = document_redline.PARALLEL_DIFF_MIN_CELLS
+        document_redline.PARALLEL_DIFF_MIN_CELLS = 0
+        try:
+            parallel = summarize(compare_all_tables(orig_tables, mod_tables))
+        finally:
+            document_redline.PARALLEL_DIFF_MIN_CELLS = original_threshold
+
+        self.assertEqual(parallel, serial)
+
+    def test_extract_tables_parses_each_file_version_once(self):
+        wb = Workbook()
+        wb.active.append(["Party", "Role"])
+        parsed = []
+        original_extractor = document_redline.extract_tables_from_xlsx
+
+        def counting_extractor(path):
+            parsed.append(path)
+            return original_extractor(path)
+
+        document_redline.extract_tables_from_xlsx = counting_extractor
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                path = os.path.join(tmpdir, "parties.xlsx")
+                wb.save(path)
+                first = extract_tables(path)
+                second = extract_tables(path)
+                self.assertEqual(len(parsed), 1)
+
+                wb.active.append(["Acme Corp", "Borrower"])
+                wb.save(path)
+                os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000_000))
+                third = extract_tables(path)
+        finally:
+            document_redline.extract_tables_from_xlsx = original_extractor
+
+        self.assertEqual(len(parsed), 2)
+        self.assertIsNot(second, first)
+        self.assertIsNot(second[0], first[0])
+        self.assertEqual([c.text for c in second[0].rows[0].cells], ["Party", "Role"])
+        self.assertEqual(len(third[0].rows), 2)
+
+    def test_output_workbook_labels_and_colors_changes(self):
+        orig = make_table("Parties", [HEADER] + ROWS)
+        mod = make_table("Parties", [HEADER, ROWS[0], ["First Bank NA", "Lender", "650,000"], ROWS[2]])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "redline.xlsx")
+            generate_output_xlsx(compare_all_tables([orig], [mod]), output_path, "orig.docx", "mod.docx")
+
+            wb = load_workbook(output_path)
+            ws = wb["Parties"]
+            labels = {row[-1].value: row[0] for row in ws.iter_rows() if row[-1].value}
+            wb.close()
+
+        self.assertIn("MODIFIED", labels)
+        modified_cell = labels["MODIFIED"]
+        self.assertEqual(modified_cell.value, "First Bank → First Bank NA")
+        self.assertEqual(modified_cell.font.color.rgb, "00CC6600")
+
+    def test_batch_results_follow_input_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for name, rows in (("orig", ROWS), ("mod", ROWS[:2])):
+                wb = Workbook()
+                for row in [HEADER] + rows:
+                    wb.active.append(row)
+                paths.append(os.path.join(tmpdir, f"{name}.xlsx"))
+                wb.save(paths[-1])
+            pairs = [
+                {"original": paths[0], "modified": paths[1]},
+                {"original": os.path.join(tmpdir, "missing.xlsx"), "modified": paths[1]},
+                {"original": paths[1], "modified": paths[0]},
+            ]
+
+            with redirect_stdout(io.StringIO()):
+                results = process_batch(pairs, tmpdir)
+
+        self.assertEqual([r["success"] for r in results], [True, False, True])
+        self.assertTrue(results[0]["output_path"].endswith("Redline_orig_vs_mod.xlsx"))
+        self.assertTrue(results[2]["output_path"].endswith("Redline_mod_vs_orig.xlsx"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from email_csv_parser import (
+    extract_domain,
+    generate_summary,
+    normalize_email,
+    parse_date,
+    parse_outlook_csv,
+    search_emails,
+)
+
+
+OUTLOOK_CSV = (
+    'Subject,Body,From: (Name),From: (Address),To: (Address),CC: (Address),Date Sent,Has Attachments\n'
+    'Purchase Agreement,See attached Purchase Agreement v3.docx,Jane Smith,"Jane Smith <Jane@Acme.com>",'
+    'bob@lender.com,,01/15/2026 9:30 AM,TRUE\n'
+    'Re: Purchase Agreement,Thanks,Bob,bob@lender.com,jane@acme.com,ops@acme.com,2026-01-16 08:05:00,FALSE\n'
+)
+
+
+class EmailCsvParserTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self._tmp.name, 'export.csv')
+        with open(self.csv_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(OUTLOOK_CSV)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_normalize_email_reads_angle_bracket_address(self):
+        self.assertEqual(normalize_email('Jane Smith <Jane@Acme.com>'), 'jane@acme.com')
+        self.assertEqual(normalize_email(' Bob@Lender.com '), 'bob@lender.com')
+        self.assertEqual(extract_domain('Jane Smith <Jane@Acme.com>'), 'acme.com')
+        self.assertEqual(extract_domain('no address'), '')
+
+    def test_parse_date_reads_outlook_formats(self):
+        self.assertEqual(parse_date('1/15/2026 9:30 AM'), '2026-01-15T09:30:00')
+        self.assertEqual(parse_date('01/15/2026 12:05 am'), '2026-01-15T00:05:00')
+        self.assertEqual(parse_date('1/15/2026 17:45'), '2026-01-15T17:45:00')
+        self.assertEqual(parse_date(' 2026-01-16T08:05:00 '), '2026-01-16T08:05:00')
+        self.assertEqual(parse_date('25/12/2026 14:00'), '2026-12-25T14:00:00')
+        self.assertEqual(parse_date('1/15/26 9:30 PM'), '2026-01-15T21:30:00')
+        self.assertEqual(parse_date('2/30/2026 9:30 AM'), '2/30/2026 9:30 AM')
+        self.assertIsNone(parse_date(''))
+
+    def test_parse_outlook_csv_maps_columns(self):
+        emails, found_columns, has_attachment_column = parse_outlook_csv(self.csv_path)
+
+        self.assertEqual(len(emails), 2)
+        self.assertIn('Date Sent', found_columns)
+        self.assertTrue(has_attachment_column)
+        first = emails[0]
+        self.assertEqual(first['subject'], 'Purchase Agreement')
+        self.assertEqual(first['from'], 'Jane Smith; Jane Smith <Jane@Acme.com>')
+        self.assertEqual(first['date_sent'], '2026-01-15T09:30:00')
+        self.assertTrue(first['has_attachments'])
+        self.assertEqual(emails[1]['cc'], 'ops@acme.com')
+        self.assertFalse(emails[1]['has_attachments'])
+        self.assertEqual(emails[1]['to_domain'], 'acme.com')
+
+    def test_generate_summary_counts_senders_and_dates(self):
+        emails, _, _ = parse_outlook_csv(self.csv_path)
+
+        summary = generate_summary(emails)
+
+        self.assertEqual(summary['total_emails'], 2)
+        self.assertEqual(summary['by_sender_domain'], {'acme.com': 1, 'lender.com': 1})
+        self.assertEqual(summary['unique_recipients'], 2)
+        self.assertEqual(summary['with_attachments'], 1)
+        self.assertEqual(summary['date_range'], {
+            'earliest': '2026-01-15T09:30:00',
+            'latest': '2026-01-16T08:05:00',
+        })
+
+    def test_search_emails_reports_matched_fields(self):
+        emails = [
+            {'subject': 'Credit Agreement', 'body': 'Draft attached', 'from': '', 'to': '',
+             'attachments': 'Credit Agreement.pdf', 'has_attachments': True},
+            {'subject': 'Loan', 'body': 'final credit terms', 'from': '', 'to': '',
+             'attachments': '', 'has_attachments': False},
+        ]
+
+        results = search_emails(emails, 'credit NOT draft')
+        self.assertEqual([r['email']['subject'] for r in results], ['Loan'])
+        self.assertEqual(results[0]['matched_fields'], ['body'])
+
+        results = search_emails(emails, '"credit agreement" attachment:.pdf')
+        self.assertEqual(len(results), 1)
+        self.assertEqual(sorted(results[0]['matched_fields']), ['attachments', 'subject'])
+
+
+if __name__ == '__main__':
+    unittest.main()